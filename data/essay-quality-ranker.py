@@ -14,7 +14,8 @@ Weights default to 0.6, 0.2, 0.2 but can be changed on the CLI.
 
 Usage
 -----
-$ pip install openai textstat language_tool_python python-dotenv tqdm rich
+$ pip install openai textstat language_tool_python python-dotenv tqdm rich numpy
+$ pip install orjson nlprule  # optional: faster cache serialization / JVM-free grammar backend
 $ export OPENAI_API_KEY="sk‑..."  # or store in .env next to the script
 $ python essay_quality_ranker.py path/to/obsidian/drafts
 
@@ -26,14 +27,24 @@ and caches results in a hidden `.cache_edit_scores` folder so you pay only once
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import os
+import re
+import socket
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Check for required dependencies
-required_packages = ['openai', 'textstat', 'language_tool_python', 'tqdm', 'rich']
+required_packages = ['openai', 'textstat', 'language_tool_python', 'tqdm', 'rich', 'numpy']
 missing_packages = []
 
 for package in required_packages:
@@ -49,36 +60,205 @@ if missing_packages:
     sys.exit(1)
 
 # Now import the required packages
+import httpx  # ships with the openai SDK
+import numpy as np
 import openai
 import textstat
 import language_tool_python
 from dotenv import load_dotenv
-from tqdm import tqdm
+from tqdm.asyncio import tqdm
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich import box
 
+# Resolve the SDK version once at import; pkg_resources scanned sys.path on
+# every llm_edit_score call (~tens of ms each). The async and batch clients
+# require the v1 SDK, so fail fast with the same register as the import check.
+from importlib.metadata import version as _pkgver
+_OPENAI_NEW_API = int(_pkgver("openai").split(".")[0]) >= 1
+if not _OPENAI_NEW_API:
+    print("Error: openai>=1.0.0 is required.")
+    print("\nPlease upgrade using:")
+    print("pip install -U openai")
+    sys.exit(1)
+
+# Minimum number of uncached files before --batch switches to the Batch API
+BATCH_THRESHOLD = 50
+
+# orjson is ~5x faster at dump and ~2x at load than stdlib json; it is
+# optional, so fall back to json with identical on-disk output if missing.
+try:
+    import orjson
+
+    def _cache_dump(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _cache_load(raw: bytes):
+        return orjson.loads(raw)
+
+    def _json_row(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _cache_dump(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _cache_load(raw: bytes):
+        return json.loads(raw)
+
+    def _json_row(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 # ------------------------------------------------------------
 # Heuristic Components
 # ------------------------------------------------------------
 
-tool = language_tool_python.LanguageTool("en-US")
+# LanguageTool runs ~45x faster as a persistent HTTP server than in per-call
+# embedded mode, and a server allows concurrent checks from the thread pool.
+LT_PORT = int(os.environ.get("LANGUAGETOOL_PORT", "8081"))
+LT_SERVER_JAR = os.environ.get("LANGUAGETOOL_JAR", "languagetool-server.jar")
 
-def grammar_error_score(text: str) -> float:
-    """Return 0‑100 scaled grammar error score (higher = worse)."""
-    matches = tool.check(text)
-    words = max(len(text.split()), 1)
-    errors_per_1k = len(matches) / words * 1000  # raw density
+def _unlink_quiet(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+def _lt_server_running() -> bool:
+    try:
+        with socket.create_connection(("localhost", LT_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+def _ensure_lt_server():
+    """Start or find the shared LanguageTool HTTP server; returns its URL.
+
+    Reuses an already-running server on LT_PORT (e.g. from a previous run or
+    another process); otherwise spawns one with maxCheckThreads raised so the
+    concurrent per-file checks don't queue behind each other. Returns None
+    when no server is reachable and no jar can be found.
+    """
+    url = f"http://localhost:{LT_PORT}"
+    if _lt_server_running():
+        return url
+
+    if Path(LT_SERVER_JAR).exists():
+        config = tempfile.NamedTemporaryFile("w", suffix=".properties", delete=False)
+        config.write("maxCheckThreads=16\n")
+        config.close()
+        # The server only reads the config at start-up, but keep the file
+        # around until exit so a slow JVM never races its deletion
+        atexit.register(_unlink_quiet, config.name)
+        proc = subprocess.Popen(
+            ["java", "-cp", LT_SERVER_JAR, "org.languagetool.server.HTTPServer",
+             "--port", str(LT_PORT), "--config", config.name, "--allow-origin", "*"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        atexit.register(proc.terminate)
+        for _ in range(60):  # give the JVM a few seconds to bind the port
+            if _lt_server_running():
+                return url
+            time.sleep(0.25)
+        proc.terminate()
+
+    return None
+
+_lt_lock = threading.Lock()
+_lt_local = threading.local()
+_lt_server_url = None
+_lt_embedded = None
+_lt_resolved = False
+
+def _get_lt():
+    """One LanguageTool server, many cheap per-thread clients.
+
+    The JVM is located/started exactly once, lazily, under a lock; each
+    scoring thread then builds its own lightweight HTTP client against the
+    shared URL so concurrent checks never contend on one client object. When
+    only embedded mode is available a single instance is shared instead -
+    one JVM per worker thread would cost ~500MB each.
+    """
+    global _lt_server_url, _lt_embedded, _lt_resolved
+    lt = getattr(_lt_local, "tool", None)
+    if lt is not None:
+        return lt
+
+    with _lt_lock:
+        if not _lt_resolved:
+            _lt_server_url = _ensure_lt_server()
+            if _lt_server_url is None:
+                # No reachable server and no jar: embedded mode (slow, but always works)
+                _lt_embedded = language_tool_python.LanguageTool("en-US")
+            _lt_resolved = True
+
+    if _lt_server_url is not None:
+        lt = language_tool_python.LanguageTool("en-US", remote_server=_lt_server_url)
+        _lt_local.tool = lt
+        return lt
+    return _lt_embedded
+
+# Selected via --grammar-backend; nlprule (a Rust port of the LT English rules)
+# is 3-5x faster and needs no JVM, but is an optional extra dependency.
+_GRAMMAR_BACKEND = "languagetool"
+_nlprule_rules = None
+
+def _get_nlprule_rules():
+    global _nlprule_rules
+    if _nlprule_rules is None:
+        try:
+            from nlprule import Rules, Tokenizer
+        except ImportError:
+            sys.exit("--grammar-backend nlprule requires the nlprule package. Install it with: pip install nlprule")
+        _nlprule_rules = Rules.load("en", Tokenizer.load("en"))
+    return _nlprule_rules
+
+@dataclass
+class Doc:
+    """A draft plus tokenization primitives, computed once and shared by every
+    scorer so multi-MB notes aren't re-tokenized per metric."""
+    text: str
+    words: List[str]
+    n_sentences: int
+    n_syllables: int
+
+    @classmethod
+    def from_text(cls, text: str) -> "Doc":
+        return cls(
+            text=text,
+            words=re.findall(r"\b\w+\b", text),
+            n_sentences=max(textstat.sentence_count(text), 1),
+            n_syllables=textstat.syllable_count(text),
+        )
+
+def _grammar_density_score(n_errors: int, doc: Doc) -> float:
+    words = max(len(doc.words), 1)
+    errors_per_1k = n_errors / words * 1000  # raw density
     # Empirically cap at density 10 => score 100
     return max(min(errors_per_1k * 10, 100), 0)
 
-def readability_score(text: str) -> float:
+def grammar_error_score(doc: Doc) -> float:
+    """Return 0‑100 scaled grammar error score (higher = worse)."""
+    if _GRAMMAR_BACKEND == "nlprule":
+        matches = _get_nlprule_rules().suggest(doc.text)
+    else:
+        matches = _get_lt().check(doc.text)
+    return _grammar_density_score(len(matches), doc)
+
+def readability_score(doc: Doc) -> float:
     """Return 0‑100 scaled readability score based on FK grade > 8."""
     try:
-        # Calculate multiple readability metrics for a more robust score
-        fk_grade = textstat.flesch_kincaid_grade(text)
-        flesch_score = textstat.flesch_reading_ease(text)
-        
+        # FRES and FKGL both derive from the Doc's shared primitives, so no
+        # further tokenization happens here.
+        total_words = len(doc.words)
+        if total_words == 0:
+            return 50.0
+
+        words_per_sentence = total_words / doc.n_sentences
+        syllables_per_word = doc.n_syllables / total_words
+        flesch_score = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        fk_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+
         # Convert Flesch Reading Ease (0-100) to a 0-100 score where higher means more difficult
         # (Flesch Reading Ease is reverse scaled - higher means easier)
         flesch_inverted = max(0, min(100, 100 - flesch_score))
@@ -95,9 +275,25 @@ def readability_score(text: str) -> float:
         print(f"Error calculating readability: {str(e)}")
         return 50.0  # Default to middle value on error
 
-def llm_edit_score(text: str, model: str = "gpt-4o-mini") -> Tuple[int, str]:
-    """Query OpenAI to get an edit effort score (0-100) and a short note."""
-    prompt = (
+def _trim(text: str, max_words: int = 5000) -> str:
+    """Sample head + middle + tail of very long drafts before prompting.
+
+    An edit-effort judgement doesn't require reading every word, and input
+    tokens dominate cost and latency for long notes, so anything above
+    `max_words` is cut to the first 2k, middle 1k and last 2k words.
+    """
+    ws = text.split()
+    if len(ws) <= max_words:
+        return text
+    mid = len(ws) // 2
+    return " ".join(
+        ws[:2000] + ["...[trimmed]..."] + ws[mid - 500:mid + 500] + ["...[trimmed]..."] + ws[-2000:]
+    )
+
+def _build_prompt(text: str) -> str:
+    """Build the edit-effort prompt shared by the live and batch API paths."""
+    text = _trim(text)
+    return (
         "You are an expert developmental editor. Read the draft below and evaluate its quality. "
         "Your task is to return a simple JSON object with exactly two keys:\n"
         "1. 'edit_effort': an integer from 0 to 100, where 100 means the draft needs heavy revision\n"
@@ -106,66 +302,122 @@ def llm_edit_score(text: str, model: str = "gpt-4o-mini") -> Tuple[int, str]:
         "Your response must be valid JSON and nothing else. No explanation, no markdown formatting.\n\n"
         "<draft>\n" + text + "\n</draft>"
     )
-    
+
+# Strict structured-output schema: the API guarantees the reply is exactly
+# this JSON shape, so no markdown-fence scrubbing or brace-hunting is needed.
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "edit",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "edit_effort": {"type": "integer", "minimum": 0, "maximum": 100},
+                "notes": {"type": "string"},
+            },
+            "required": ["edit_effort", "notes"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+def _parse_llm_content(content: str) -> Tuple[int, str]:
+    """Extract (edit_effort, notes) from a structured-output model reply."""
+    data = json.loads(content)
+
+    # Validate values
+    edit_effort = int(data.get("edit_effort", 50))
+    # Ensure it's within 0-100 range
+    edit_effort = max(0, min(100, edit_effort))
+
+    notes = data.get("notes", "").strip()
+    if not notes:
+        notes = "No specific issues noted"
+
+    return edit_effort, notes
+
+async def llm_edit_score(text: str, client, model: str = "gpt-4o-mini") -> Tuple[int, str]:
+    """Query OpenAI to get an edit effort score (0-100) and a short note."""
+    prompt = _build_prompt(text)
+
     try:
-        # Check OpenAI version and use appropriate API call
-        import pkg_resources
-        openai_version = pkg_resources.get_distribution("openai").version
-        is_new_api = int(openai_version.split('.')[0]) >= 1
-        
-        if is_new_api:
-            # For OpenAI v1.0.0+
-            resp = openai.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
-                max_tokens=100,
-            )
-            content = resp.choices[0].message.content.strip()
-        else:
-            # For OpenAI < v1.0.0
-            resp = openai.ChatCompletion.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
-                max_tokens=100,
-            )
-            content = resp.choices[0].message.content.strip()
-        
-        # Clean up the response to ensure it's valid JSON
-        # Remove markdown code block formatting if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.endswith("```"):
-            content = content[:-3]
-        
-        # Remove any leading/trailing non-JSON characters
-        content = content.strip()
-        
-        # Try to find valid JSON in the string using { } as delimiters
-        if '{' in content and '}' in content:
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            content = content[start:end]
-        
-        data = json.loads(content)
-        
-        # Validate values
-        edit_effort = int(data.get("edit_effort", 50))
-        # Ensure it's within 0-100 range
-        edit_effort = max(0, min(100, edit_effort))
-        
-        notes = data.get("notes", "").strip()
-        if not notes:
-            notes = "No specific issues noted"
-            
-        return edit_effort, notes
-    
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=100,
+            response_format=_RESPONSE_FORMAT,
+        )
+        content = resp.choices[0].message.content.strip()
+        return _parse_llm_content(content)
+
     except Exception as e:
         # Log the error and return fallback values
         print(f"Error parsing LLM response: {str(e)}")
         return 50, f"LLM parse error: {str(e)[:50]}"
 
+def batch_edit_scores(texts: Dict[str, str], model: str, poll_interval: float = 30.0) -> Dict[str, Tuple[int, str]]:
+    """Score many drafts in one OpenAI Batch API job (50% cheaper, higher rate limits).
+
+    `texts` maps an identifier (the file path) to the draft text. Returns a dict
+    mapping each identifier to its (edit_effort, notes) tuple. Blocks until the
+    batch completes, polling every `poll_interval` seconds.
+    """
+    client = openai.OpenAI()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False, encoding="utf-8") as f:
+        for custom_id, text in texts.items():
+            f.write(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": _build_prompt(text)}],
+                    "temperature": 0.0,
+                    "max_tokens": 100,
+                    "response_format": _RESPONSE_FORMAT,
+                },
+            }, ensure_ascii=False) + "\n")
+        requests_path = f.name
+
+    try:
+        with open(requests_path, "rb") as f:
+            batch_file = client.files.create(file=f, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        # Status goes to stderr: with --json, stdout must stay pure JSON
+        print(f"Submitted batch {batch.id} with {len(texts)} requests; polling every {poll_interval:.0f}s...",
+              file=sys.stderr)
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            sys.exit(f"Batch {batch.id} ended with status '{batch.status}'.")
+
+        scores: Dict[str, Tuple[int, str]] = {}
+        output = client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            custom_id = row["custom_id"]
+            try:
+                content = row["response"]["body"]["choices"][0]["message"]["content"].strip()
+                scores[custom_id] = _parse_llm_content(content)
+            except Exception as e:
+                print(f"Error parsing batch response for {custom_id}: {str(e)}")
+                scores[custom_id] = (50, f"LLM parse error: {str(e)[:50]}")
+        return scores
+    finally:
+        os.unlink(requests_path)
+
 # ------------------------------------------------------------
 # Core Processing
 # ------------------------------------------------------------
@@ -174,15 +426,120 @@ def composite_score(llm: float, grammar: float, readability: float, w: Tuple[flo
     a, b, c = w
     return a * llm + b * grammar + c * readability
 
-def process_file(path: Path, weights, cache_dir: Path, model: str):
-    cached = cache_dir / (path.stem + ".json")
+def rank_results(results: List[dict], w: Tuple[float, float, float]) -> List[dict]:
+    """Recompute composites and sort worst-first, vectorized over all rows.
+
+    Stacks the three component scores into float32 arrays (structure-of-arrays)
+    so the weighted sum and the sort ordering run as single NumPy C loops
+    instead of per-dict Python float math and key calls.
+    """
+    n = len(results)
+    llm_arr = np.fromiter((r["llm_score"] for r in results), dtype=np.float32, count=n)
+    gr_arr = np.fromiter((r["grammar_score"] for r in results), dtype=np.float32, count=n)
+    rd_arr = np.fromiter((r["readability_score"] for r in results), dtype=np.float32, count=n)
+    comp_arr = w[0] * llm_arr + w[1] * gr_arr + w[2] * rd_arr
+    order = np.argsort(-comp_arr, kind="stable")
+    for i, comp in enumerate(comp_arr):
+        results[i]["composite_score"] = float(comp)
+    return [results[i] for i in order]
+
+def _cache_key(text: str, model: str, weights) -> str:
+    """Cache key over content + scoring parameters, so renames stay cached and
+    edits (or a different model/weighting) invalidate automatically."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(text.encode("utf-8"))
+    h.update(model.encode())
+    h.update(repr(tuple(weights)).encode())
+    return h.hexdigest()
+
+_cache_index_lock = threading.Lock()
+
+def _update_cache_index(cache_dir: Path, digest: str, path: Path):
+    """Record digest -> note path in cache_dir/index.json.
+
+    The cache files themselves are named by opaque content hashes; the index
+    keeps them correlatable with the vault (and follows renames, since hits
+    re-record the current path)."""
+    index_file = cache_dir / "index.json"
+    with _cache_index_lock:
+        try:
+            index = _cache_load(index_file.read_bytes())
+        except (OSError, ValueError):
+            index = {}
+        if index.get(digest) != str(path):
+            index[digest] = str(path)
+            index_file.write_bytes(_cache_dump(index))
+
+def _iter_md(root, excludes: frozenset):
+    """Recursively yield .md files under `root` with os.scandir.
+
+    scandir returns type information with each entry (glob stats every path
+    separately) and excluded directories are pruned before descent, so their
+    subtrees are never walked at all. `excludes` holds pre-resolved Paths;
+    each directory is resolved once and skipped when it is an excluded folder
+    or sits anywhere beneath one. Unreadable directories (protected sync or
+    trash folders) are skipped rather than aborting the run, like glob did.
+    """
+    try:
+        with os.scandir(root) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            dir_path = Path(entry.path).resolve()
+            if dir_path not in excludes and excludes.isdisjoint(dir_path.parents):
+                yield from _iter_md(entry.path, excludes)
+        elif entry.name.endswith(".md"):
+            yield Path(entry.path)
+
+async def process_file(path: Path, weights, cache_dir: Path, model: str, client,
+                       llm_result: Tuple[int, str] = None, fast: bool = False):
+    # Read off the event loop so slow disks (NFS/iCloud-backed vaults) overlap
+    text = await asyncio.to_thread(path.read_text, encoding="utf-8", errors="ignore")
+    key = _cache_key(text, model, weights)
+    cached = cache_dir / (key + ".json")
     if cached.exists():
-        return json.loads(cached.read_text())
+        result = _cache_load(cached.read_bytes())
+        result["file"] = str(path)  # the note may have moved since it was cached
+        _update_cache_index(cache_dir, key, path)
+        return result
+    # Tokenize once; every scorer below shares the same Doc primitives.
+    doc = await asyncio.to_thread(Doc.from_text, text)
 
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    llm, note = llm_edit_score(text, model=model)
-    grammar = grammar_error_score(text)
-    read = readability_score(text)
+    a, b, c = weights
+    skipped = False
+    if llm_result is not None or not fast:
+        # The three scorers are independent: run the LLM call, the grammar
+        # check (socket I/O) and the readability math (C extension)
+        # concurrently so wall time per file is the max of the three.
+        if llm_result is not None:
+            llm_coro = asyncio.sleep(0, result=llm_result)
+        else:
+            llm_coro = llm_edit_score(text, client, model=model)
+        (llm, note), grammar, read = await asyncio.gather(
+            llm_coro,
+            asyncio.to_thread(grammar_error_score, doc),
+            asyncio.to_thread(readability_score, doc),
+        )
+    else:
+        # --fast: run the cheap local scorers first (concurrently with each
+        # other); if they already pin the composite inside one display bucket,
+        # the LLM term cannot change the verdict and the API call is skipped.
+        grammar, read = await asyncio.gather(
+            asyncio.to_thread(grammar_error_score, doc),
+            asyncio.to_thread(readability_score, doc),
+        )
+        lo = b * grammar + c * read            # composite if the LLM scored 0
+        hi = a * 100 + b * grammar + c * read  # composite if the LLM scored 100
+        if lo >= 70 or hi < 40:
+            # Any LLM score lands in the same red/green bucket; record the
+            # neutral midpoint rather than paying for a call that can't
+            # change the answer.
+            llm, note = 50, "skipped (verdict bounded by grammar/readability)"
+            skipped = True
+        else:
+            llm, note = await llm_edit_score(text, client, model=model)
     comp = composite_score(llm, grammar, read, weights)
 
     result = {
@@ -193,9 +550,86 @@ def process_file(path: Path, weights, cache_dir: Path, model: str):
         "composite_score": comp,
         "notes": note,
     }
-    cached.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    # Skipped rows carry an approximated llm_score; never persist them, or the
+    # real judgment could never be obtained later under the same cache key.
+    if not skipped:
+        cached.write_bytes(_cache_dump(result))
+        _update_cache_index(cache_dir, key, path)
     return result
 
+async def _gather_bounded(coros, limit: int = 20):
+    """Run coroutines concurrently, at most `limit` in flight at once."""
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(coro):
+        async with sem:
+            return await coro
+
+    return await tqdm.gather(*(_run(c) for c in coros), desc="Scoring drafts")
+
+def _render_table(results: List[dict]) -> Table:
+    """Build the rankings table for a (sorted) result list."""
+    # Change the box style to include vertical column separators
+    table = Table(show_header=True, header_style="bold magenta", box=box.SIMPLE)
+    table.add_column("File", style="dim")
+    table.add_column("Score", justify="right")
+    table.add_column("LLM", justify="right")
+    table.add_column("Grammar", justify="right")
+    table.add_column("Readability", justify="right")
+    table.add_column("Notes")
+
+    for r in results:
+        # Format scores
+        comp_score = f"{r['composite_score']:.1f}"
+        llm_score = f"{r['llm_score']}"
+        grammar_score = f"{r['grammar_score']:.1f}"
+        readability_score = f"{r['readability_score']:.1f}"
+
+        # Extract filename from path for cleaner display
+        filename = Path(r['file']).name
+
+        # Determine row color based on score
+        score_val = float(comp_score)
+        if score_val >= 70:
+            row_style = "red"
+        elif score_val >= 40:
+            row_style = "yellow"
+        else:
+            row_style = "green"
+
+        table.add_row(
+            filename,
+            comp_score,
+            llm_score,
+            grammar_score,
+            readability_score,
+            r['notes'],
+            style=row_style
+        )
+
+    return table
+
+async def _score_live(tasks, weights, console: Console, limit: int = 20):
+    """Score concurrently while streaming the re-ranked table to the terminal.
+
+    Rather than staring at a progress bar until every file is done, each
+    completed file is merged into the table immediately, so the worst drafts
+    surface as soon as they are scored.
+    """
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(coro):
+        async with sem:
+            return await coro
+
+    results: List[dict] = []
+    with Live(_render_table(results), console=console, refresh_per_second=4) as live:
+        for fut in asyncio.as_completed([_run(t) for t in tasks]):
+            results.append(await fut)
+            results = rank_results(results, weights)
+            live.update(_render_table(results))
+    return results
+
 # ------------------------------------------------------------
 # CLI
 # ------------------------------------------------------------
@@ -210,39 +644,82 @@ def main():
     else:
         sys.exit("OPENAI_API_KEY not set. Export it or put it in a .env file.")
     
-    parser = argparse.ArgumentParser(description="Rank Markdown drafts by editing effort.")
+    parser = argparse.ArgumentParser(
+        description="Rank Markdown drafts by editing effort. "
+                    "Drafts over 5000 words are sampled (head + middle + tail) before the LLM call to bound token cost.")
     parser.add_argument("folder", type=Path, help="Folder containing .md files")
     parser.add_argument("--output", "-o", type=Path, help="Optional CSV output file")
     parser.add_argument("--weights", nargs=3, type=float, metavar=("LLM", "GRAM", "READ"), default=(0.6, 0.2, 0.2))
     parser.add_argument("--model", default="gpt-4o-mini", help="OpenAI model name")
+    parser.add_argument("--grammar-backend", choices=("languagetool", "nlprule"), default="languagetool",
+                        help="Grammar checker: languagetool (default) or nlprule (faster, no JVM, pip install nlprule)")
     parser.add_argument("--json", action="store_true", help="Output results as JSON instead of a table")
+    parser.add_argument("--fast", action="store_true",
+                        help="Skip the LLM call for files whose grammar/readability scores already decide the "
+                             "red/green verdict (their llm_score is approximated and not cached). Whether any "
+                             "file can qualify depends on --weights: the LLM weight must stay below 0.4 for "
+                             "green skips or the other weights must sum past 0.7 for red ones")
+    parser.add_argument("--batch", action="store_true",
+                        help=f"Use the OpenAI Batch API (50%% cheaper, up to 24h turnaround) when more than {BATCH_THRESHOLD} files need scoring")
     parser.add_argument("--exclude-folders", "-e", nargs="*", default=[], help="Subfolder names to exclude (relative to folder)")
     args = parser.parse_args()
 
-    md_files: List[Path] = list(args.folder.glob("**/*.md"))
-    # Exclude specified subfolders if any
-    if args.exclude_folders:
-        # Normalize exclude paths
-        exclude_paths = [Path(args.folder / excl).resolve() for excl in args.exclude_folders]
-        # Normalize and compare full paths
-        md_files = [p for p in md_files if not any(
-            str(p.resolve()).startswith(str(excl_path))
-            for excl_path in exclude_paths
-        )]
+    global _GRAMMAR_BACKEND
+    _GRAMMAR_BACKEND = args.grammar_backend
+
+    if args.fast:
+        a, b, c = args.weights
+        # lo >= 70 needs the non-LLM weights to reach 70 on their own;
+        # hi < 40 needs the LLM ceiling alone to stay under 40. If neither
+        # bound is reachable, --fast can never skip a call - say so instead
+        # of silently doing nothing (the default 0.6/0.2/0.2 weights hit this).
+        if (b + c) * 100 < 70 and a * 100 >= 40:
+            print(f"Warning: --fast cannot skip any LLM calls with weights {a}/{b}/{c}; "
+                  "lower the LLM weight below 0.4 (or raise the others past 0.7 combined) for the bound to be reachable.",
+                  file=sys.stderr)
+
+    # Resolve exclusions once up front; the per-directory test is then pure
+    # set membership with no further stat calls or string prefix matching
+    exclude_paths = frozenset(Path(args.folder, excl).resolve() for excl in args.exclude_folders)
+    md_files: List[Path] = sorted(_iter_md(args.folder, exclude_paths))
     if not md_files:
         sys.exit("No .md files found in the specified folder.")
 
     cache_dir = args.folder / ".cache_edit_scores"
     cache_dir.mkdir(exist_ok=True)
 
-    results = []
-    for fp in tqdm(md_files, desc="Scoring drafts"):
-        results.append(process_file(fp, args.weights, cache_dir, args.model))
+    # One shared client with a keepalive pool sized for the gather fan-out, so
+    # every concurrent request reuses warm TLS connections instead of paying a
+    # fresh handshake.
+    client = openai.AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+        ),
+    )
 
-    results.sort(key=lambda r: r["composite_score"], reverse=True)
+    batch_scores: Dict[str, Tuple[int, str]] = {}
+    if args.batch:
+        texts = {}
+        for fp in md_files:
+            text = fp.read_text(encoding="utf-8", errors="ignore")
+            if not (cache_dir / (_cache_key(text, args.model, args.weights) + ".json")).exists():
+                texts[str(fp)] = text
+        if len(texts) > BATCH_THRESHOLD:
+            batch_scores = batch_edit_scores(texts, args.model)
+        elif texts:
+            print(f"Only {len(texts)} uncached files; scoring live instead of via the Batch API.",
+                  file=sys.stderr)
+
+    tasks = [process_file(fp, args.weights, cache_dir, args.model, client,
+                          llm_result=batch_scores.get(str(fp)), fast=args.fast)
+             for fp in md_files]
 
     # Output JSON if requested
     if args.json:
+        results = asyncio.run(_gather_bounded(tasks, limit=20))
+        results = rank_results(results, args.weights)
+
         # Prepare results for JSON output, using relative paths
         base_path = str(args.folder.resolve())
         for r in results:
@@ -250,59 +727,28 @@ def main():
             full_path = r["file"]
             if full_path.startswith(base_path):
                 r["file"] = full_path[len(base_path):].lstrip('/\\')
-        
-        # Print the JSON output
-        print(json.dumps(results))
+
+        # Stream one row at a time to stdout so huge runs never build the
+        # whole JSON string in memory
+        out = sys.stdout.buffer
+        out.write(b"[")
+        for i, r in enumerate(results):
+            if i:
+                out.write(b",")
+            out.write(_json_row(r))
+        out.write(b"]\n")
+        out.flush()
         return
 
-    # Output results to CLI using Rich
+    # Output results to CLI using Rich, streaming rows as files finish
     console = Console()
-    
-    # Change the box style to include vertical column separators
-    table = Table(show_header=True, header_style="bold magenta", box=box.SIMPLE)
-    table.add_column("File", style="dim")
-    table.add_column("Score", justify="right")
-    table.add_column("LLM", justify="right")
-    table.add_column("Grammar", justify="right")
-    table.add_column("Readability", justify="right")
-    table.add_column("Notes")
-    
-    for r in results:
-        # Format scores
-        comp_score = f"{r['composite_score']:.1f}"
-        llm_score = f"{r['llm_score']}"
-        grammar_score = f"{r['grammar_score']:.1f}"
-        readability_score = f"{r['readability_score']:.1f}"
-        
-        # Extract filename from path for cleaner display
-        filename = Path(r['file']).name
-        
-        # Determine row color based on score
-        score_val = float(comp_score)
-        if score_val >= 70:
-            row_style = "red"
-        elif score_val >= 40:
-            row_style = "yellow"
-        else:
-            row_style = "green"
-            
-        table.add_row(
-            filename, 
-            comp_score,
-            llm_score,
-            grammar_score,
-            readability_score,
-            r['notes'],
-            style=row_style
-        )
-    
     console.print("\n📝 Essay Quality Rankings (higher score = needs more work)\n")
-    console.print(table)
-    
+    results = asyncio.run(_score_live(tasks, args.weights, console))
+
     # Optionally save to CSV if requested
     if args.output:
         import csv
-        with open(args.output, "w", newline="", encoding="utf-8") as f:
+        with open(args.output, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             writer = csv.DictWriter(f, fieldnames=results[0].keys())
             writer.writeheader()
             writer.writerows(results)